@@ -377,6 +377,31 @@ def git_get_modified_python_files(
     return {path for path in changed_paths if should_reformat_file(cwd / path)}
 
 
+@lru_cache(maxsize=1)
+def _git_get_content_at_revision_cached(
+    path: Path, revision: str, cwd: Path
+) -> TextDocument:
+    """Get unmodified text lines of a file at a Git revision, caching the latest result
+
+    The ``isort`` step and every round of the Black context lines binary search compare
+    the same file to the same ``rev1``. Caching the most recent result avoids spawning
+    ``git show`` and ``git log`` again for each of those comparisons. A cache size of one
+    is enough because all calls for the same ``(path, revision, cwd)`` come back to back
+    within one Darker run.
+
+    The cache is keyed on ``revision`` as given, e.g. ``HEAD`` or a branch name, not on
+    the commit it resolves to. If that ref is moved, e.g. by a new commit, the cache
+    keeps returning the old content. Like `_compare_revisions`, this is only safe within
+    a single run in which refs don't change, so don't reuse it across ref changes.
+
+    :param path: The relative path of the file in the Git repository
+    :param revision: The Git revision for which to get the file content
+    :param cwd: The root of the Git repository
+
+    """
+    return git_get_content_at_revision(path, revision, cwd)
+
+
 def _revision_vs_lines(
     root: Path, path_in_repo: Path, rev1: str, content: TextDocument, context_lines: int
 ) -> List[int]:
@@ -399,7 +424,10 @@ def _revision_vs_lines(
     :return: Line numbers of lines changed between the revision and given content
 
     """
-    old = git_get_content_at_revision(path_in_repo, rev1, root)
+    old = _git_get_content_at_revision_cached(path_in_repo, rev1, root)
+    if old == content:
+        # Nothing was edited, skip diffing and looking for multi-line strings
+        return []
     edited_opcodes = diff_and_get_opcodes(old, content)
     multiline_string_ranges = get_multiline_string_ranges(content)
     return list(
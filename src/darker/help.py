@@ -1,21 +1,25 @@
 """Help and usage instruction texts used for the command line parser"""
 
+from importlib.util import find_spec
+
+# Only probe for the optional `isort` package without importing it, so importing the
+# help texts (e.g. for `darker.command_line` alone) doesn't import `isort`. The
+# `darker` command itself still imports `isort` via `darker.import_sorting`, which is
+# also where a missing or broken `isort` is reported when `--isort` is used.
+_HAS_ISORT = find_spec("isort") is not None
+
 ISORT_INSTRUCTION = "Please run `pip install darker[isort]`"
 
-DESCRIPTION_PARTS = [
-    "Re-format Python source files by using\n",
+DESCRIPTION = (
+    "Re-format Python source files by using\n"
     "- `isort` to sort Python import definitions alphabetically within logical"
-    " sections\n",
-    "- `black` to re-format code changed since the last Git commit",
-]
-try:
-    import isort
-except ImportError:
-    isort = None  # type: ignore[assignment]
-    DESCRIPTION_PARTS.extend(
-        ["\n", "\n", f"{ISORT_INSTRUCTION} to enable sorting of import definitions"]
-    )
-DESCRIPTION = "".join(DESCRIPTION_PARTS)
+    " sections\n"
+    "- `black` to re-format code changed since the last Git commit"
+) + (
+    ""
+    if _HAS_ISORT
+    else f"\n\n{ISORT_INSTRUCTION} to enable sorting of import definitions"
+)
 
 
 SRC = "Path(s) to the Python source file(s) to reformat"
@@ -48,10 +52,9 @@ STDOUT = (
     " `pygments` package is available, or if enabled by configuration."
 )
 
-ISORT_PARTS = ["Also sort imports using the `isort` package"]
-if not isort:
-    ISORT_PARTS.append(f". {ISORT_INSTRUCTION} to enable usage of this option.")
-ISORT = "".join(ISORT_PARTS)
+ISORT = "Also sort imports using the `isort` package" + (
+    "" if _HAS_ISORT else f". {ISORT_INSTRUCTION} to enable usage of this option."
+)
 
 LINT = (
     "Also run a linter on changed files. `CMD` can be a name of path of the"
@@ -85,6 +85,9 @@ def apply_isort(
         return content
     isort_args = _build_isort_args(src, config, line_length)
     rev2_isorted = _call_isort_code(content, isort_args)
+    if rev2_isorted is content:
+        # isort made no changes, no need to diff
+        return content
     # Get the chunks in the diff between the edited and import-sorted file
     isort_chunks = diff_chunks(content, rev2_isorted)
     if not isort_chunks:
@@ -126,6 +129,8 @@ def _build_isort_args(
 def _call_isort_code(content: TextDocument, isort_args: IsortArgs) -> TextDocument:
     """Call ``isort.code()`` and return the result as a `TextDocument` object
 
+    If ``isort`` makes no changes, the original `TextDocument` object is returned.
+
     :param content: The contents of the Python source code file to sort imports in
     :param isort_args: Keyword arguments for ``isort.code()``
 
@@ -139,6 +144,8 @@ def _call_isort_code(content: TextDocument, isort_args: IsortArgs) -> TextDocume
         code = isort_code(code=code, **isort_args)
     except isort.exceptions.FileSkipComment:
         pass
+    if code == content.string:
+        return content
     return TextDocument.from_str(
         code,
         encoding=content.encoding,
@@ -21,6 +21,7 @@ provided that the ``<linenum>`` falls on a changed line.
 
 import logging
 from contextlib import contextmanager
+from io import StringIO
 from pathlib import Path
 from subprocess import PIPE, Popen  # nosec
 from typing import IO, Generator, List, Set, Tuple
@@ -62,31 +63,19 @@ def _parse_linter_line(line: str, root: Path) -> Tuple[Path, int, str, str]:
     return path_in_repo, linenum, location + ":", description
 
 
-def _require_rev2_worktree(rev2: str) -> None:
-    """Exit with an error message if ``rev2`` is not ``WORKTREE``
-
-    This is used when running linters since linting arbitrary commits is not supported.
-
-    :param rev2: The ``rev2`` revision to lint.
-
-    """
-    if rev2 != WORKTREE:
-        raise NotImplementedError(
-            "Linting arbitrary commits is not supported. "
-            "Please use -r {<rev>|<rev>..|<rev>...} instead."
-        )
-
-
 @contextmanager
 def _check_linter_output(
     cmdline: str, root: Path, paths: Set[Path]
 ) -> Generator[IO[str], None, None]:
-    """Run a linter as a subprocess and return its standard output stream
+    """Run a linter as a subprocess and return its standard output as a text stream
+
+    The complete output is read and decoded in one go instead of line by line.
+    Newlines are normalized to ``\\n`` like in universal newlines mode.
 
     :param cmdline: The command line for running the linter
     :param root: The common root of all files to lint
     :param paths: Paths of files to check, relative to ``git_root``
-    :return: The standard output stream of the linter subprocess
+    :return: The standard output of the linter subprocess
 
     """
     cmdline_and_paths = cmdline.split() + [str(root / path) for path in sorted(paths)]
@@ -94,12 +83,12 @@ def _check_linter_output(
     with Popen(  # nosec
         cmdline_and_paths,
         stdout=PIPE,
-        encoding="utf-8",
     ) as linter_process:
         # condition needed for MyPy (see https://stackoverflow.com/q/57350490/15770)
         if linter_process.stdout is None:
             raise RuntimeError("Stdout piping failed")
-        yield linter_process.stdout
+        output = linter_process.stdout.read().decode("utf-8")
+        yield StringIO(output, newline=None)
 
 
 def run_linter(
@@ -114,7 +103,11 @@ def run_linter(
     :return: The number of modified lines with linting errors from this linter
 
     """
-    _require_rev2_worktree(revrange.rev2)
+    if revrange.rev2 != WORKTREE:
+        raise NotImplementedError(
+            "Linting arbitrary commits is not supported. "
+            "Please use -r {<rev>|<rev>..|<rev>...} instead."
+        )
     if not paths:
         return 0
     error_count = 0
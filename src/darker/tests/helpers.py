@@ -3,6 +3,7 @@
 import re
 import sys
 from contextlib import contextmanager, nullcontext
+from importlib.machinery import ModuleSpec
 from types import ModuleType
 from typing import Any, ContextManager, Dict, List, Optional, Union
 from unittest.mock import patch
@@ -66,6 +67,8 @@ def isort_present(present):
     if present:
         # Inject a dummy `isort` package temporarily
         fake_isort_module: Optional[ModuleType] = ModuleType("isort")
+        # a module spec is required by `importlib.util.find_spec()`:
+        fake_isort_module.__spec__ = ModuleSpec("isort", None)
         # dummy function required by `import_sorting`:
         fake_isort_module.code = None  # type: ignore
     else:
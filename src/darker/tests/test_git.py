@@ -857,6 +857,38 @@ def test_edited_linenums_differ_revision_vs_lines(git_repo, context_lines, expec
     assert linenums == expect
 
 
+def test_edited_linenums_differ_revision_vs_lines_caches_git_content(git_repo):
+    """``revision_vs_lines()`` doesn't get the same historical content from Git twice"""
+    git_repo.add({"a.py": "1\n2\n3\n"}, commit="Initial commit")
+    content = TextDocument.from_lines(["1", "two", "3"])
+    revrange = git.RevisionRange("HEAD", ":WORKTREE:")
+    differ = git.EditedLinenumsDiffer(git_repo.root, revrange)
+    with patch.object(
+        git, "git_get_content_at_revision", wraps=git.git_get_content_at_revision
+    ) as get_content:
+
+        linenums_0 = differ.revision_vs_lines(Path("a.py"), content, 0)
+        linenums_1 = differ.revision_vs_lines(Path("a.py"), content, 1)
+
+    assert linenums_0 == [2]
+    assert linenums_1 == [1, 2, 3]
+    get_content.assert_called_once_with(Path("a.py"), "HEAD", git_repo.root)
+
+
+def test_edited_linenums_differ_revision_vs_lines_unchanged(git_repo):
+    """``revision_vs_lines()`` skips diffing if content is identical to ``rev1``"""
+    git_repo.add({"a.py": "1\n2\n3\n"}, commit="Initial commit")
+    content = TextDocument.from_lines(["1", "2", "3"])
+    revrange = git.RevisionRange("HEAD", ":WORKTREE:")
+    differ = git.EditedLinenumsDiffer(git_repo.root, revrange)
+    with patch.object(git, "diff_and_get_opcodes") as diff_and_get_opcodes:
+
+        linenums = differ.revision_vs_lines(Path("a.py"), content, 3)
+
+    assert linenums == []
+    diff_and_get_opcodes.assert_not_called()
+
+
 @pytest.mark.kwparametrize(
     dict(context_lines=0, expect=[1, 3, 4, 5, 6, 8]),
     dict(context_lines=1, expect=[1, 2, 3, 4, 5, 6, 7, 8]),
@@ -184,6 +184,15 @@ def test_build_isort_args(src, config, line_length, expect):
     assert result == expect
 
 
+def test_call_isort_code_unchanged():
+    """``_call_isort_code()`` returns the original document if nothing was sorted"""
+    content = TextDocument.from_str("import os\nimport sys\n")
+
+    result = darker.import_sorting._call_isort_code(content, {})
+
+    assert result is content
+
+
 def test_isort_file_skip_comment():
     """``apply_isort()`` handles ``FileSkipComment`` exception correctly"""
     # Avoid https://github.com/PyCQA/isort/pull/1833 by splitting the skip string
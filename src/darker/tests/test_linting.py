@@ -10,22 +10,33 @@ from unittest.mock import call, patch
 import pytest
 
 from darker import linting
-from darker.git import WORKTREE, RevisionRange
-from darker.tests.helpers import raises_if_exception
-
-
-@pytest.mark.kwparametrize(
-    dict(
-        line="module.py:42: Description\n",
-        expect=(Path("module.py"), 42, "module.py:42:", "Description"),
-    ),
-    dict(
-        line="module.py:42:5: Description\n",
-        expect=(Path("module.py"), 42, "module.py:42:5:", "Description"),
-    ),
-    dict(line="no-linenum.py: Description\n", expect=(Path(), 0, "", "")),
-    dict(line="mod.py:invalid-linenum:5: Description\n", expect=(Path(), 0, "", "")),
-    dict(line="invalid linter output\n", expect=(Path(), 0, "", "")),
+from darker.git import RevisionRange
+
+_ROOT_SUB_RE = re.compile(r"\{root/(.*?)\}")
+
+_ONE = Path("one.py")
+_TWO = Path("two.py")
+_MISSING = Path("missing.py")
+_DUMMY_PATHS = {Path("dummy paths")}
+_DUMMY_ROOT = Path("dummy root")
+_DUMMY_REVRANGE = RevisionRange("dummy rev1", "dummy rev2")
+
+
+@pytest.mark.parametrize(
+    "line, expect",
+    [
+        (
+            "module.py:42: Description\n",
+            (Path("module.py"), 42, "module.py:42:", "Description"),
+        ),
+        (
+            "module.py:42:5: Description\n",
+            (Path("module.py"), 42, "module.py:42:5:", "Description"),
+        ),
+        ("no-linenum.py: Description\n", (Path(), 0, "", "")),
+        ("mod.py:invalid-linenum:5: Description\n", (Path(), 0, "", "")),
+        ("invalid linter output\n", (Path(), 0, "", "")),
+    ],
 )
 def test_parse_linter_line(git_repo, monkeypatch, line, expect):
     """Linter output is parsed correctly"""
@@ -36,17 +47,6 @@ def test_parse_linter_line(git_repo, monkeypatch, line, expect):
     assert result == expect
 
 
-@pytest.mark.kwparametrize(
-    dict(rev2="master", expect=NotImplementedError),
-    dict(rev2=WORKTREE, expect=None),
-)
-def test_require_rev2_worktree(rev2, expect):
-    """``_require_rev2_worktree`` raises an exception if rev2 is not ``WORKTREE``"""
-    with raises_if_exception(expect):
-
-        linting._require_rev2_worktree(rev2)
-
-
 def test_check_linter_output():
     """``_check_linter_output()`` runs linter and returns the stdout stream"""
     with linting._check_linter_output(
@@ -59,80 +59,88 @@ def test_check_linter_output():
     ]
 
 
-@pytest.mark.kwparametrize(
-    dict(
-        _descr="No files to check, no output",
-        paths=[],
-        location="test.py:1:",
-        expect_output=[],
-        expect_log=[],
-    ),
-    dict(
-        _descr="Check one file, report on a modified line in test.py",
-        paths=["one.py"],
-        location="test.py:1:",
-        expect_output=["", "test.py:1: {root/one.py}"],
-        expect_log=[],
-    ),
-    dict(
-        _descr="Check one file, report on a column of a modified line in test.py",
-        paths=["one.py"],
-        location="test.py:1:42:",
-        expect_output=["", "test.py:1:42: {root/one.py}"],
-        expect_log=[],
-    ),
-    dict(
-        _descr="No output if report is on an unmodified line in test.py",
-        paths=["one.py"],
-        location="test.py:2:42:",
-        expect_output=[],
-        expect_log=[],
-    ),
-    dict(
-        _descr="No output if report is on a column of an unmodified line in test.py",
-        paths=["one.py"],
-        location="test.py:2:42:",
-        expect_output=[],
-        expect_log=[],
-    ),
-    dict(
-        _descr="Check two files, report on a modified line in test.py",
-        paths=["one.py", "two.py"],
-        location="test.py:1:",
-        expect_output=["", "test.py:1: {root/one.py} {root/two.py}"],
-        expect_log=[],
-    ),
-    dict(
-        _descr="Check two files, rpeort on a column of a modified line in test.py",
-        paths=["one.py", "two.py"],
-        location="test.py:1:42:",
-        expect_output=["", "test.py:1:42: {root/one.py} {root/two.py}"],
-        expect_log=[],
-    ),
-    dict(
-        _descr="No output if 2-file report is on an unmodified line in test.py",
-        paths=["one.py", "two.py"],
-        location="test.py:2:",
-        expect_output=[],
-        expect_log=[],
-    ),
-    dict(
-        _descr="No output if 2-file report is on a column of an unmodified line",
-        paths=["one.py", "two.py"],
-        location="test.py:2:42:",
-        expect_output=[],
-        expect_log=[],
-    ),
-    dict(
-        _descr="Warning for a file missing from the working tree",
-        paths=["missing.py"],
-        location="missing.py:1:",
-        expect_output=[],
-        expect_log=["WARNING Missing file missing.py from echo missing.py:1:"],
-    ),
+def test_check_linter_output_newlines(tmp_path):
+    """``_check_linter_output()`` converts all newlines in linter output to ``\\n``"""
+    linter_output = tmp_path / "dummy-linter-output.txt"
+    linter_output.write_bytes(b"a.py:1: CRLF\r\na.py:2: CR\ra.py:3: LF\n")
+
+    with linting._check_linter_output("cat", tmp_path, {linter_output}) as stdout:
+        lines = list(stdout)
+
+    assert lines == ["a.py:1: CRLF\n", "a.py:2: CR\n", "a.py:3: LF\n"]
+
+
+@pytest.mark.parametrize(
+    "paths, location, expect_output, expect_log",
+    [
+        pytest.param(set(), "test.py:1:", [], [], id="No files to check, no output"),
+        pytest.param(
+            {_ONE},
+            "test.py:1:",
+            ["", "test.py:1: {root/one.py}"],
+            [],
+            id="Check one file, report on a modified line in test.py",
+        ),
+        pytest.param(
+            {_ONE},
+            "test.py:1:42:",
+            ["", "test.py:1:42: {root/one.py}"],
+            [],
+            id="Check one file, report on a column of a modified line in test.py",
+        ),
+        pytest.param(
+            {_ONE},
+            "test.py:2:",
+            [],
+            [],
+            id="No output if report is on an unmodified line in test.py",
+        ),
+        pytest.param(
+            {_ONE},
+            "test.py:2:42:",
+            [],
+            [],
+            id="No output if report is on a column of an unmodified line in test.py",
+        ),
+        pytest.param(
+            {_ONE, _TWO},
+            "test.py:1:",
+            ["", "test.py:1: {root/one.py} {root/two.py}"],
+            [],
+            id="Check two files, report on a modified line in test.py",
+        ),
+        pytest.param(
+            {_ONE, _TWO},
+            "test.py:1:42:",
+            ["", "test.py:1:42: {root/one.py} {root/two.py}"],
+            [],
+            id="Check two files, rpeort on a column of a modified line in test.py",
+        ),
+        pytest.param(
+            {_ONE, _TWO},
+            "test.py:2:",
+            [],
+            [],
+            id="No output if 2-file report is on an unmodified line in test.py",
+        ),
+        pytest.param(
+            {_ONE, _TWO},
+            "test.py:2:42:",
+            [],
+            [],
+            id="No output if 2-file report is on a column of an unmodified line",
+        ),
+        pytest.param(
+            {_MISSING},
+            "missing.py:1:",
+            [],
+            ["WARNING Missing file missing.py from echo missing.py:1:"],
+            id="Warning for a file missing from the working tree",
+        ),
+    ],
 )
 def test_run_linter(
-    git_repo, capsys, caplog, _descr, paths, location, expect_output, expect_log
+    git_repo, capsys, caplog, paths, location, expect_output, expect_log
 ):
     """Linter gets correct paths on command line and outputs just changed lines
 
@@ -152,16 +160,15 @@ def test_run_linter(
     cmdline = f"echo {location}"
     revrange = RevisionRange("HEAD", ":WORKTREE:")
 
-    linting.run_linter(
-        cmdline, git_repo.root, {Path(p) for p in paths}, revrange, use_color=False
-    )
+    linting.run_linter(cmdline, git_repo.root, paths, revrange, use_color=False)
 
     # We can now verify that the linter received the correct paths on its command line
     # by checking standard output from the our `echo` "linter".
     # The test cases also verify that only linter reports on modified lines are output.
     result = capsys.readouterr().out.splitlines()
+    root = git_repo.root
     assert result == [
-        re.sub(r"\{root/(.*?)\}", lambda m: str(git_repo.root / m.group(1)), line)
+        _ROOT_SUB_RE.sub(lambda m: str(root / m.group(1)), line)
         for line in expect_output
     ]
     logs = [f"{record.levelname} {record.message}" for record in caplog.records]
@@ -174,9 +181,9 @@ def test_run_linter_non_worktree():
 
         linting.run_linter(
             "dummy-linter",
-            Path("/dummy"),
-            {Path("dummy.py")},
-            RevisionRange.parse_with_common_ancestor("..HEAD", Path("dummy cwd")),
+            _DUMMY_ROOT,
+            _DUMMY_PATHS,
+            RevisionRange.parse_with_common_ancestor("..HEAD", _DUMMY_ROOT),
             use_color=False,
         )
 
@@ -206,42 +213,17 @@ def test_run_linter_return_value(git_repo, location, expect):
     assert result == expect
 
 
-@pytest.mark.kwparametrize(
-    dict(
-        linter_cmdlines=[],
-        linters_return=[],
-        expect_result=0,
-    ),
-    dict(
-        linter_cmdlines=["linter"],
-        linters_return=[0],
-        expect_result=0,
-    ),
-    dict(
-        linter_cmdlines=["linter"],
-        linters_return=[1],
-        expect_result=1,
-    ),
-    dict(
-        linter_cmdlines=["linter"],
-        linters_return=[42],
-        expect_result=42,
-    ),
-    dict(
-        linter_cmdlines=["linter1", "linter2"],
-        linters_return=[0, 0],
-        expect_result=0,
-    ),
-    dict(
-        linter_cmdlines=["linter1", "linter2"],
-        linters_return=[0, 42],
-        expect_result=42,
-    ),
-    dict(
-        linter_cmdlines=["linter1", "linter2 command line"],
-        linters_return=[42, 42],
-        expect_result=84,
-    ),
+@pytest.mark.parametrize(
+    "linter_cmdlines, linters_return, expect_result",
+    [
+        ([], [], 0),
+        (["linter"], [0], 0),
+        (["linter"], [1], 1),
+        (["linter"], [42], 42),
+        (["linter1", "linter2"], [0, 0], 0),
+        (["linter1", "linter2"], [0, 42], 42),
+        (["linter1", "linter2 command line"], [42, 42], 84),
+    ],
 )
 def test_run_linters(linter_cmdlines, linters_return, expect_result):
     """Unit test for ``run_linters()``"""
@@ -250,18 +232,18 @@ def test_run_linters(linter_cmdlines, linters_return, expect_result):
 
         result = linting.run_linters(
             linter_cmdlines,
-            Path("dummy root"),
-            {Path("dummy paths")},
-            RevisionRange("dummy rev1", "dummy rev2"),
+            _DUMMY_ROOT,
+            _DUMMY_PATHS,
+            _DUMMY_REVRANGE,
             use_color=False,
         )
 
         expect_calls = [
             call(
                 linter_cmdline,
-                Path("dummy root"),
+                _DUMMY_ROOT,
                 {Path("dummy paths")},
-                RevisionRange("dummy rev1", "dummy rev2"),
+                _DUMMY_REVRANGE,
                 False,
             )
             for linter_cmdline in linter_cmdlines
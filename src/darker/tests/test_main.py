@@ -144,6 +144,10 @@ A_PY_DIFF_BLACK_ISORT = [
         black_exclude={Path("a.py")},
         expect=[A_PY_ISORT],
     ),
+    dict(
+        black_exclude={Path("b.py")},
+        expect=[A_PY_BLACK_ISORT],
+    ),
     black_config={},
     black_exclude=set(),
     isort_exclude=set(),
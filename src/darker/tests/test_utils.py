@@ -1,6 +1,6 @@
 """Unit tests for :mod:`darker.utils`"""
 
-# pylint: disable=redefined-outer-name, comparison-with-callable
+# pylint: disable=redefined-outer-name, comparison-with-callable, protected-access
 
 import logging
 import os
@@ -9,12 +9,14 @@ from textwrap import dedent
 
 import pytest
 
+import darker.utils
 from darker.utils import (
     TextDocument,
     debug_dump,
     detect_newline,
     get_common_root,
     get_path_ancestry,
+    glob_any,
     joinlines,
 )
 
@@ -394,3 +396,45 @@ def test_textdocument_from_file(tmp_path):
     assert document.encoding == "iso-8859-1"
     assert document.newline == "\r\n"
     assert document.mtime == "2001-09-09 01:46:40.000000 +0000"
+
+
+@pytest.mark.kwparametrize(
+    dict(path="a.py", patterns=set(), expect=False),
+    dict(path="a.py", patterns={"a.py"}, expect=True),
+    dict(path="a.py", patterns={"b.py"}, expect=False),
+    dict(path="a.py", patterns={"b.py", "a.py"}, expect=True),
+    dict(path="dir/a.py", patterns={"a.py"}, expect=False),
+    dict(path="dir/a.py", patterns={"dir/a.py"}, expect=True),
+    dict(path="a.py", patterns={"*.py"}, expect=True),
+    dict(path="dir/a.py", patterns={"*.py"}, expect=False),
+    dict(path="dir/a.py", patterns={"dir/?.py"}, expect=True),
+    dict(path="dir/ab.py", patterns={"dir/?.py"}, expect=False),
+    dict(path="a.py", patterns={"**/*"}, expect=True),
+    dict(path="dir/sub/a.py", patterns={"**/*"}, expect=True),
+    dict(path="dir/sub/a.py", patterns={"dir/**"}, expect=True),
+    dict(path="other/a.py", patterns={"dir/**"}, expect=False),
+    dict(path="a+b.py", patterns={"a+b.py"}, expect=True),
+    dict(path="aab.py", patterns={"a+b.py"}, expect=False),
+    dict(path="dir/a.py", patterns={"b.py", "dir/*.py"}, expect=True),
+    dict(path="dir/a.py", patterns={"dir/a.py", "*.py"}, expect=True),
+)
+def test_glob_any(path, patterns, expect):
+    """``glob_any()`` matches complete relative paths against glob patterns"""
+    result = glob_any(Path(path), patterns)
+
+    assert result == expect
+
+
+def test_glob_any_path_patterns():
+    """``glob_any()`` also accepts `Path` objects as literal patterns"""
+    assert glob_any(Path("dir/a.py"), {Path("dir/a.py")})
+    assert not glob_any(Path("dir/a.py"), {Path("dir/b.py")})
+
+
+def test_glob_any_literal_paths_skip_regex():
+    """``glob_any()`` doesn't compile a regular expression for literal paths only"""
+    patterns = frozenset({"a.py", "dir/b.py"})
+
+    result = darker.utils._compile_glob_patterns(patterns)
+
+    assert result == (patterns, None)
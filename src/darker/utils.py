@@ -2,11 +2,22 @@
 
 import io
 import logging
+import re
 import tokenize
 from datetime import datetime
+from functools import lru_cache
 from itertools import chain
-from pathlib import Path
-from typing import Collection, Iterable, List, Tuple, Union
+from pathlib import Path, PurePath
+from typing import (
+    Collection,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +26,9 @@ TextLines = Tuple[str, ...]
 
 GIT_DATEFORMAT = "%Y-%m-%d %H:%M:%S.%f +0000"
 
+# Glob pattern characters supported by `glob_any`. Patterns without them are literal.
+GLOB_MAGIC_RE = re.compile(r"[*?]")
+
 
 def detect_newline(string: str) -> str:
     """Detect LF or CRLF newlines in a string by looking at the end of the first line"""
@@ -248,14 +262,73 @@ class Buf:
             self.seek_line(-1)
 
 
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a glob pattern into a regular expression for matching a complete path
+
+    ``**/`` matches zero or more directories, ``**`` matches anything, ``*`` matches
+    anything except ``/`` and ``?`` matches any single character except ``/``.
+
+    :param pattern: The glob pattern, using ``/`` as the path separator
+    :return: The regular expression
+
+    """
+    regex = []
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            regex.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("**", index):
+            regex.append(".*")
+            index += 2
+        else:
+            char = pattern[index]
+            regex.append({"*": "[^/]*", "?": "[^/]"}.get(char, re.escape(char)))
+            index += 1
+    return "".join(regex)
+
+
+@lru_cache(maxsize=16)
+def _compile_glob_patterns(
+    patterns: FrozenSet[str],
+) -> Tuple[FrozenSet[str], Optional[Pattern[str]]]:
+    """Split glob patterns into literal paths and one regular expression for the rest
+
+    Literal paths can be matched with a set lookup. Black exclusions consist only of
+    literal paths of modified files, so they never need a regular expression.
+
+    This is cached so the patterns are only processed once for each collection of
+    patterns, not once for every file they're matched against.
+
+    :param patterns: The glob patterns to compile
+    :return: The literal paths, and a compiled regular expression matching any of the
+             remaining patterns or ``None`` if there are no such patterns
+
+    """
+    posix_patterns = {PurePath(pattern).as_posix() for pattern in patterns}
+    literals = frozenset(p for p in posix_patterns if not GLOB_MAGIC_RE.search(p))
+    globs = posix_patterns - literals
+    if not globs:
+        return literals, None
+    regex = re.compile("|".join(f"(?:{_glob_to_regex(p)})" for p in globs))
+    return literals, regex
+
+
 def glob_any(path: Path, patterns: Collection[str]) -> bool:
     """Return `True` if path matches any of the patterns
 
-    Return `False` if there are no patterns to match.
+    Return `False` if there are no patterns to match. Each pattern is matched against
+    the complete relative path, see `_glob_to_regex` for the supported syntax.
 
     :param path: The file path to match
     :param patterns: The patterns to match against
     :return: `True` if at least one pattern matches
 
     """
-    return any(path.glob(pattern) for pattern in patterns)
+    if not patterns:
+        return False
+    literals, regex = _compile_glob_patterns(frozenset(patterns))
+    posix_path = path.as_posix()
+    if posix_path in literals:
+        return True
+    return regex is not None and regex.fullmatch(posix_path) is not None